@@ -17,6 +17,8 @@ import re  # Import the regular expression module
 from config import DATABASE, LOG_FILE
 from data_summarizer import process_and_aggregate_news, generate_insights, main as summarizer_main
 import threading
+import queue
+from contextlib import contextmanager
 from functools import wraps
 import time
 # Import the Telegram bot functions
@@ -96,15 +98,58 @@ def ensure_event_loop():
         asyncio.set_event_loop(loop)
     return loop
 
-def get_db():
-    conn = sqlite3.connect(DATABASE)
+# Long-lived connections shared by the (threaded) request handlers instead of
+# opening a new connection per request
+DB_POOL_SIZE = 4
+_db_pool = queue.Queue()
+_db_pool_lock = threading.Lock()
+_db_pool_created = 0
+
+def _open_db():
+    # Autocommit; multi-statement writes open their own BEGIN IMMEDIATE
+    conn = sqlite3.connect(DATABASE, check_same_thread=False, isolation_level=None)
     conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
     return conn
 
+@contextmanager
+def get_db():
+    """
+    Borrow a pooled connection for the duration of a `with` block.
+    Connections are in autocommit mode; an explicit transaction left open by
+    the block is committed when it succeeds and rolled back on error.
+    """
+    global _db_pool_created
+    try:
+        conn = _db_pool.get_nowait()
+    except queue.Empty:
+        conn = None
+        with _db_pool_lock:
+            if _db_pool_created < DB_POOL_SIZE:
+                conn = _open_db()
+                _db_pool_created += 1
+        if conn is None:
+            conn = _db_pool.get()
+    try:
+        with conn:
+            yield conn
+    finally:
+        _db_pool.put(conn)
+
+# Statements used to sync the sources table with SOURCES_FILE
+SQL_INSERT_SOURCE = "INSERT OR IGNORE INTO sources (url, name, source_type, category) VALUES (?, ?, ?, ?)"
+SQL_UPDATE_SOURCE = """
+    UPDATE sources 
+    SET name = ?, source_type = ?, category = ? 
+    WHERE url = ? AND (name != ? OR source_type != ? OR category != ?)
+"""
+
 def init_db():
     """Initialize the database with the schema defined in schema.sql"""
     with app.app_context():
-        db = get_db()
+        db = _open_db()
         with open('schema.sql', 'r') as f:
             db.cursor().executescript(f.read())
         
@@ -126,7 +171,7 @@ def init_db():
             sources = sources_data['sources']
             logger.info(f"Loaded {len(sources)} sources from {SOURCES_FILE}")
             
-            cursor = db.cursor()
+            rows = []
             for source in sources:
                 if not all(key in source for key in ['url', 'source_type', 'category']):
                     logger.warning(f"Skipping source with missing data: {source}")
@@ -134,23 +179,17 @@ def init_db():
                     
                 # Extract name from source or use a default based on the URL
                 name = source.get('name', source['url'].split('/')[-1])
-                
-                cursor.execute(
-                    "INSERT OR IGNORE INTO sources (url, name, source_type, category) VALUES (?, ?, ?, ?)",
-                    (source['url'], name, source['source_type'], source['category'])
-                )
-                
-                # If the source exists but has different values, update it
-                cursor.execute(
-                    """
-                    UPDATE sources 
-                    SET name = ?, source_type = ?, category = ? 
-                    WHERE url = ? AND (name != ? OR source_type != ? OR category != ?)
-                    """,
-                    (name, source['source_type'], source['category'], 
-                     source['url'], name, source['source_type'], source['category'])
-                )
-                
+                rows.append((source['url'], name, source['source_type'], source['category']))
+            
+            # Insert new sources, then update existing ones whose values differ, in one transaction
+            cursor = db.cursor()
+            cursor.execute("BEGIN")
+            cursor.executemany(SQL_INSERT_SOURCE, rows)
+            cursor.executemany(
+                SQL_UPDATE_SOURCE,
+                [(name, source_type, category, url, name, source_type, category)
+                 for url, name, source_type, category in rows]
+            )
             db.commit()
             logger.info(f'Sources table populated from {SOURCES_FILE}')
             
@@ -669,7 +708,6 @@ async def submit_feedback():
                 "INSERT INTO feedback (email, message, type) VALUES (?, ?, ?)",
                 (data['email'], data['message'], data['type'])
             )
-            conn.commit()
         
         # Send Telegram notification
         try:
@@ -753,24 +791,22 @@ async def subscribe():
         # Get source (optional)
         source = data.get('source', 'main')
         
-        # Store subscription in database
+        # Store subscription in database; insert-or-update runs in one write transaction
         with get_db() as conn:
             cursor = conn.cursor()
-            try:
-                cursor.execute(
-                    "INSERT INTO subscribers (email, source) VALUES (?, ?)",
-                    (email, source)
-                )
-                conn.commit()
-                is_new = True
-            except sqlite3.IntegrityError:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute(
+                "INSERT OR IGNORE INTO subscribers (email, source) VALUES (?, ?)",
+                (email, source)
+            )
+            is_new = cursor.rowcount == 1
+            if not is_new:
                 # Email already exists, update the source instead
                 cursor.execute(
                     "UPDATE subscribers SET source = ?, created_at = CURRENT_TIMESTAMP WHERE email = ?",
                     (source, email)
                 )
-                conn.commit()
-                is_new = False
+            conn.commit()
         
         # Send Telegram notification 
         try:
@@ -3,7 +3,6 @@ import asyncio
 import os
 import sqlite3
 import logging
-import sys
 import json
 from datetime import datetime, timezone, timedelta
 import feedparser  # For parsing RSS feeds
@@ -14,8 +13,9 @@ from telethon import TelegramClient
 from telethon.tl.functions.messages import GetHistoryRequest
 from dotenv import load_dotenv
 import telethon.errors
-from parser import extract_summary  # Import only the extraction function, get_summary_from_db is used internally
-from config import DATABASE, LOG_FILE, TELEGRAM_SESSION
+from parser import extract_summary, browser_pool, flush_pending_summaries  # get_summary_from_db is used internally by extract_summary
+from config import DATABASE, TELEGRAM_SESSION
+from logging_setup import get_module_logger
 from google import genai
 from instruction_templates import INSTRUCTIONS
 # Import Telegram bot notification function
@@ -29,22 +29,7 @@ except ImportError:
 
 
 # Configure module-specific logger
-logger = logging.getLogger('data_fetcher')
-logger.setLevel(logging.DEBUG)  # Set module level to DEBUG
-
-# Check if the logger already has handlers to avoid duplicate handlers
-if not logger.handlers:
-    # Create file handler that logs to the same file
-    file_handler = logging.FileHandler(LOG_FILE)
-    file_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(name)s:%(lineno)d - %(funcName)s() - %(message)s'))
-    
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(name)s:%(lineno)d - %(funcName)s() - %(message)s'))
-    
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+logger = get_module_logger('data_fetcher', logging.DEBUG)  # Set module level to DEBUG
 
 # Now the logger is configured specifically for this module with DEBUG level
 logger.info("Data fetcher module initializing")
@@ -1156,26 +1141,35 @@ async def main():
     telegram_data = {}
     rss_data = {}
     
-    # Fetch messages from Telegram channels
-    # telegram_channels = telegram_channels[:2]
-    if telegram_channels:
-        telegram_data = await fetch_telegram_messages(telegram_channels, time_range=time_range, enable_retries=False, debug_mode=False)
+    try:
+        # Links are extracted one at a time and usually without a browser, so one warm browser is enough
+        if telegram_channels or rss_feeds:
+            await browser_pool.warm_up(1)
+        
+        # Fetch messages from Telegram channels
+        # telegram_channels = telegram_channels[:2]
+        if telegram_channels:
+            telegram_data = await fetch_telegram_messages(telegram_channels, time_range=time_range, enable_retries=False, debug_mode=False)
         
-        # Print the results
-        for channel, message_ids in telegram_data.items():
-            logger.info(f"\nTelegram channel: {channel}")
-            logger.info(f"Number of messages saved to database: {len(message_ids)}")
-            logger.info(f"Message IDs: {message_ids}")
+            # Print the results
+            for channel, message_ids in telegram_data.items():
+                logger.info(f"\nTelegram channel: {channel}")
+                logger.info(f"Number of messages saved to database: {len(message_ids)}")
+                logger.info(f"Message IDs: {message_ids}")
     
-    # Fetch RSS feeds
-    if rss_feeds:
-        rss_data = await fetch_rss_feeds(rss_feeds, time_range=time_range, enable_retries=False, debug_mode=False)
+        # Fetch RSS feeds
+        if rss_feeds:
+            rss_data = await fetch_rss_feeds(rss_feeds, time_range=time_range, enable_retries=False, debug_mode=False)
         
-        # Print the results
-        for feed, message_ids in rss_data.items():
-            logger.info(f"\nRSS feed: {feed}")
-            logger.info(f"Number of entries saved to database: {len(message_ids)}")
-            logger.info(f"Message IDs: {message_ids}")
+            # Print the results
+            for feed, message_ids in rss_data.items():
+                logger.info(f"\nRSS feed: {feed}")
+                logger.info(f"Number of entries saved to database: {len(message_ids)}")
+                logger.info(f"Message IDs: {message_ids}")
+    finally:
+        # Commit any queued link summaries and shut down the browsers kept warm for extraction
+        await flush_pending_summaries()
+        await browser_pool.close()
     
     # # Send notification through Telegram bot
     # if telegram_bot_available:
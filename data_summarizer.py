@@ -11,7 +11,8 @@ from google.genai import types
 import os
 import traceback
 from dotenv import load_dotenv
-from config import DATABASE, LOG_FILE
+from config import DATABASE
+from logging_setup import get_module_logger
 from instruction_templates import INSTRUCTIONS
 from typing import Dict, Any
 import litellm
@@ -23,22 +24,7 @@ import litellm
 load_dotenv()
 
 # Configure module-specific logger
-logger = logging.getLogger('data_summarizer')
-logger.setLevel(logging.DEBUG)  # Set module level to DEBUG
-
-# Check if the logger already has handlers to avoid duplicate handlers
-if not logger.handlers:
-    # Create file handler that logs to the same file
-    file_handler = logging.FileHandler(LOG_FILE)
-    file_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(name)s:%(lineno)d - %(funcName)s() - %(message)s'))
-    
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(name)s:%(lineno)d - %(funcName)s() - %(message)s'))
-    
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+logger = get_module_logger('data_summarizer', logging.DEBUG)  # Set module level to DEBUG
 
 logger.info("Data summarizer module initializing")
 
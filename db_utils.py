@@ -0,0 +1,17 @@
+import sqlite3
+import logging
+import functools
+from config import DATABASE
+
+logger = logging.getLogger('db_utils')
+
+@functools.lru_cache(maxsize=None)
+def get_db_connection():
+    """Create the database connection once and return it on every call"""
+    logger.debug(f"Opening database connection to {DATABASE}")
+    conn = sqlite3.connect(DATABASE, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    logger.debug("Database connection established")
+    return conn
@@ -1,6 +1,9 @@
 # explore_endpoints.py
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
 import sqlite3
 from config import DATABASE
 import random
@@ -8,6 +11,13 @@ import random
 # Define the base URL of your backend (adjust if your app is running on a different port or address)
 BASE_URL = "http://127.0.0.1:5000"  # Default Flask development server address
 
+# One keep-alive session for every call, retrying transient failures on idempotent requests
+# (summaries/insights can take minutes to generate, hence the long read timeout)
+REQUEST_TIMEOUT = (3, 300)  # (connect, read) seconds
+http = requests.Session()
+http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                  max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])))
+
 def get_message_content(message_id):
     """Fetch message content from database by ID"""
     try:
@@ -40,9 +50,9 @@ def explore_sources_endpoint():
     This endpoint is used by the frontend to populate the source selection UI."""
     url = f"{BASE_URL}/sources"
     try:
-        response = requests.get(url)
+        response = http.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()  # Raise an exception for bad status codes
-        data = response.json()
+        data = orjson.loads(response.content)
         print("\n--- /sources Endpoint Content (GET) ---")
         
         if "sources" in data:
@@ -113,9 +123,9 @@ def explore_summaries_endpoint():
         print("Sources: All available sources")
     
     try:
-        response = requests.get(url)
+        response = http.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Get the number of topics
         topics = data.get("topics", [])
@@ -190,9 +200,9 @@ def explore_insights_endpoint(summaries_data=None):
     # Send the POST request
     url = f"{BASE_URL}/insights"
     try:
-        response = requests.post(url, json=summaries_data)
+        response = http.post(url, json=summaries_data, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Get the topics with insights
         topics_with_insights = data.get("topics", [])
@@ -311,9 +321,9 @@ def explore_legacy_insights_endpoint():
         print("Sources: All available sources")
     
     try:
-        response = requests.get(url)
+        response = http.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Get the number of topics
         topics = data.get("topics", [])
@@ -408,9 +418,9 @@ def simulate_frontend_flow():
     print("\nStep 1: Fetching available sources...")
     try:
         sources_url = f"{BASE_URL}/sources"
-        response = requests.get(sources_url)
+        response = http.get(sources_url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        sources_data = response.json()
+        sources_data = orjson.loads(response.content)
         
         categorized_sources = sources_data.get("sources", {})
         source_count = sum(len(sources) for sources in categorized_sources.values())
@@ -449,9 +459,9 @@ def simulate_frontend_flow():
         
         print(f"Fetching summaries with: {query_params}")
         summaries_url = f"{BASE_URL}/summaries?{query_params}"
-        response = requests.get(summaries_url)
+        response = http.get(summaries_url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        summaries_data = response.json()
+        summaries_data = orjson.loads(response.content)
         
         topics = summaries_data.get("topics", [])
         print(f"Received {len(topics)} topics")
@@ -474,9 +484,9 @@ def simulate_frontend_flow():
         insights_request = {"topics": [first_topic]}
         
         insights_url = f"{BASE_URL}/insights"
-        response = requests.post(insights_url, json=insights_request)
+        response = http.post(insights_url, json=insights_request, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        insights_data = response.json()
+        insights_data = orjson.loads(response.content)
         
         topics_with_insights = insights_data.get("topics", [])
         print(f"Received {len(topics_with_insights)} topics with insights")
@@ -531,9 +541,9 @@ def simulate_legacy_frontend_flow():
     print("\nStep 1: Fetching sources (this populates the source selection UI)")
     url = f"{BASE_URL}/sources"
     try:
-        response = requests.get(url)
+        response = http.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        sources_data = response.json()
+        sources_data = orjson.loads(response.content)
         
         # Extract sources from the response
         all_sources = []
@@ -562,9 +572,9 @@ def simulate_legacy_frontend_flow():
             query_params["sources"] = ",".join(selected_sources)
         
         insights_url = f"{BASE_URL}/insights"
-        response = requests.get(insights_url, params=query_params)
+        response = http.get(insights_url, params=query_params, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        insights_data = response.json()
+        insights_data = orjson.loads(response.content)
         
         topics = insights_data.get("topics", [])
         print(f"Received {len(topics)} topics with insights")
@@ -0,0 +1,59 @@
+import sys
+import queue
+import atexit
+import logging
+import logging.handlers
+from config import LOG_FILE
+
+# Shared format for every module logger
+LOG_FORMAT = '%(asctime)s [%(levelname)s] %(name)s:%(lineno)d - %(funcName)s() - %(message)s'
+
+# All module loggers enqueue records here; a single background listener owns the
+# file and console handlers, so logging calls never block on disk or stdout writes
+_log_queue = queue.SimpleQueue()
+_listener = None
+
+def _start_listener():
+    """Start the background listener that writes queued records to LOG_FILE and stdout"""
+    global _listener
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    # Create file handler that logs to the shared log file
+    file_handler = logging.FileHandler(LOG_FILE)
+    file_handler.setFormatter(formatter)
+
+    # Create console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+
+    _listener = logging.handlers.QueueListener(_log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+def get_module_logger(name, level=logging.INFO):
+    """
+    Return the named logger, attached to the shared logging queue.
+
+    Args:
+        name: Logger name, usually the module name
+        level: Level to set on the logger
+
+    Returns:
+        The configured logging.Logger
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+
+    # Check if the logger already has handlers to avoid duplicate handlers
+    if not logger.handlers:
+        if _listener is None:
+            _start_listener()
+        logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    return logger
+
+def stop_logging():
+    """Flush every queued record and stop the background listener"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
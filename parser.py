@@ -1,60 +1,146 @@
 import os
 import asyncio
 import json
+import orjson
 import time
 import sqlite3
 import logging
-import sys
-import traceback
+import queue
+import threading
+import functools
+import copy
+import random
+import string
 from pydantic import BaseModel
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+from collections import OrderedDict, defaultdict
+from urllib.parse import urlparse
+from contextlib import contextmanager
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode, LLMConfig
 from crawl4ai.extraction_strategy import LLMExtractionStrategy
+from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+from crawl4ai.content_filter_strategy import PruningContentFilter
+from crawl4ai.models import TokenUsage
 from instruction_templates import INSTRUCTIONS, DEFAULT_INSTRUCTION
 import litellm
-from config import DATABASE, LOG_FILE
+import aiohttp
+from config import DATABASE
+from logging_setup import get_module_logger, stop_logging
 
 # Custom JSON formatter for logs
 def format_json(obj):
     """Format an object as pretty JSON if it's a dict or list, otherwise return as string"""
     if isinstance(obj, (dict, list)):
-        return "\n" + json.dumps(obj, indent=2)
+        return "\n" + orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
     return str(obj)
 
-# Configure module-specific logger
-logger = logging.getLogger('parser')
-logger.setLevel(logging.INFO)  # Set module level to INFO
-
-# Check if the logger already has handlers to avoid duplicate handlers
-if not logger.handlers:
-    # Create file handler that logs to the same file
-    file_handler = logging.FileHandler(LOG_FILE)
-    file_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(name)s:%(lineno)d - %(funcName)s() - %(message)s'))
-    
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(name)s:%(lineno)d - %(funcName)s() - %(message)s'))
-    
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+# Configure module-specific logger, INFO unless overridden (e.g. LOG_LEVEL=WARNING in production)
+logger = get_module_logger('parser', os.getenv('LOG_LEVEL', 'INFO').upper())
 
 logger.info("Parser module initializing")
 
 # Database file path
 logger.info(f"Database path: {DATABASE}")
 
+# Read once at import; every extraction strategy needs it
+_GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
+if not _GEMINI_API_KEY:
+    raise RuntimeError("GEMINI_API_KEY is not set; the parser cannot run LLM extraction without it")
+
 class Article(BaseModel):
     name: str
     summarized_content: str
 
-def get_db_connection():
-    """Create and return a database connection"""
-    logger.info(f"Opening database connection to {DATABASE}")
-    conn = sqlite3.connect(DATABASE)
-    conn.row_factory = sqlite3.Row  # Return rows as dictionaries
-    logger.info("Database connection established")
-    return conn
+# The extraction schema never changes, so serialize it once instead of per URL
+ARTICLE_SCHEMA = Article.schema_json()
+
+_DEFAULT_INSTRUCTION_TEXT = INSTRUCTIONS[DEFAULT_INSTRUCTION]
+
+@functools.lru_cache(maxsize=None)
+def _instruction_for(instruction_type: str):
+    """
+    Resolve an instruction type to (instruction_text, is_templated), falling back to the default.
+    Instructions without replacement fields are returned pre-formatted so callers can skip .format().
+    """
+    if instruction_type not in INSTRUCTIONS:
+        logger.warning(f"Instruction type '{instruction_type}' not found. Using default.")
+    instruction_text = INSTRUCTIONS.get(instruction_type, _DEFAULT_INSTRUCTION_TEXT)
+    if any(field is not None for _, field, _, _ in string.Formatter().parse(instruction_text)):
+        return instruction_text, True
+    return instruction_text.format(), False
+
+# SQL reused on every lookup/save; keeping the same strings lets each connection's
+# statement cache skip re-preparing them
+_SELECT_SUMMARY_SQL = "SELECT summary_content FROM link_summaries WHERE url = ?"
+_INSERT_SUMMARY_SQL = "INSERT OR REPLACE INTO link_summaries (url, summary_content, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)"
+_CACHED_STATEMENTS = 256
+
+# Long-lived connections: one writer (serialized by a lock) and a small pool of readers
+_READER_POOL_SIZE = 4
+_writer_conn = None
+_writer_lock = threading.Lock()
+_reader_pool = queue.Queue()
+_db_init_lock = threading.Lock()
+
+def _get_writer_connection():
+    """Return the shared writer connection, opening it in WAL mode on first use"""
+    global _writer_conn
+    with _db_init_lock:
+        if _writer_conn is None:
+            logger.info(f"Opening writer database connection to {DATABASE}")
+            conn = sqlite3.connect(DATABASE, check_same_thread=False, isolation_level=None, cached_statements=_CACHED_STATEMENTS)
+            conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            _writer_conn = conn
+
+            # Readers are opened after the writer so the database is already in WAL mode
+            for _ in range(_READER_POOL_SIZE):
+                reader = sqlite3.connect(f"file:{DATABASE}?mode=ro", uri=True, check_same_thread=False, cached_statements=_CACHED_STATEMENTS)
+                reader.row_factory = sqlite3.Row
+                reader.execute("PRAGMA busy_timeout=5000")
+                _reader_pool.put(reader)
+            logger.info(f"Database connection pool established ({_READER_POOL_SIZE} readers)")
+        return _writer_conn
+
+@contextmanager
+def get_reader_connection():
+    """Borrow a read-only connection from the pool for the duration of the block"""
+    _get_writer_connection()
+    conn = _reader_pool.get()
+    try:
+        yield conn
+    finally:
+        _reader_pool.put(conn)
+
+# Bounded in-process LRU of summaries keyed by URL, so hot links skip SQLite entirely
+_SUMMARY_CACHE_MAX_SIZE = 4096
+_summary_cache = OrderedDict()
+_summary_cache_lock = threading.Lock()
+
+def _get_cached_summary(url: str) -> Optional[str]:
+    """Return the cached summary for a URL, or None if it isn't cached"""
+    with _summary_cache_lock:
+        summary_content = _summary_cache.get(url)
+        if summary_content is not None:
+            _summary_cache.move_to_end(url)
+        return summary_content
+
+def _cache_summary(url: str, summary_content: str):
+    """Store a summary in the LRU cache, evicting the least recently used entry if full"""
+    with _summary_cache_lock:
+        _summary_cache[url] = summary_content
+        _summary_cache.move_to_end(url)
+        if len(_summary_cache) > _SUMMARY_CACHE_MAX_SIZE:
+            _summary_cache.popitem(last=False)
+
+def _uncache_summaries(rows):
+    """Drop the cached summaries of rows whose write failed, so they aren't mistaken for saved ones"""
+    with _summary_cache_lock:
+        for url, summary_content in rows:
+            if _summary_cache.get(url) == summary_content:
+                del _summary_cache[url]
 
 def get_summary_from_db(url: str) -> Dict[str, Any]:
     """
@@ -66,85 +152,381 @@ def get_summary_from_db(url: str) -> Dict[str, Any]:
     Returns:
         A dictionary with the summary content or None if not found
     """
+    cached_content = _get_cached_summary(url)
+    if cached_content is not None:
+        logger.info(f"Summary for {url} found in memory cache")
+        return {"content": cached_content}
+
     logger.info(f"Checking if summary for URL exists in database: {url}")
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT summary_content FROM link_summaries WHERE url = ?", (url,))
-        result = cursor.fetchone()
+        with get_reader_connection() as conn:
+            result = conn.execute(_SELECT_SUMMARY_SQL, (url,)).fetchone()
         
         if result:
             logger.info(f"Summary for {url} found in database")
-            logger.info(f"Full summary content from database: {result['summary_content']}")
+            logger.debug("Full summary content from database: %s", result['summary_content'])
+            _cache_summary(url, result["summary_content"])
             return {"content": result["summary_content"]}
         
         logger.info(f"No summary found in database for {url}")
         return None
     except Exception as e:
-        logger.error(f"Error retrieving summary from database: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error retrieving summary from database: %s", e)
         return None
-    finally:
-        if conn:
-            logger.info("Closing database connection")
-            conn.close()
+
+# Summaries are queued and committed in batches by a background task instead of
+# one transaction per extracted link
+_WRITE_BATCH_SIZE = 500  # SQLite-friendly ceiling on rows per executemany
+_WRITE_BATCH_WAIT = 1.0  # seconds to wait for more rows before flushing
+_write_queue = None
+_write_queue_loop = None
+_flush_task = None
+
+def _write_summaries(rows):
+    """Insert or replace a batch of (url, summary_content) rows in a single transaction"""
+    conn = _get_writer_connection()
+    with _writer_lock:
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(_INSERT_SUMMARY_SQL, rows)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+async def _flush_writer():
+    """
+    Drain the write queue, committing up to _WRITE_BATCH_SIZE rows or whatever arrived within _WRITE_BATCH_WAIT.
+    When cancelled (e.g. asyncio.run() shutting down after an exception) the rows still
+    pending are written synchronously so queued summaries are never lost.
+    """
+    loop = asyncio.get_running_loop()
+    rows = []
+    try:
+        while True:
+            rows = [await _write_queue.get()]
+            deadline = loop.time() + _WRITE_BATCH_WAIT
+            while len(rows) < _WRITE_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    rows.append(await asyncio.wait_for(_write_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await asyncio.to_thread(_write_summaries, rows)
+                logger.info(f"Saved batch of {len(rows)} summaries to database")
+            except Exception as e:
+                logger.exception("Error saving summary batch to database: %s", e)
+                _uncache_summaries(rows)
+            finally:
+                for _ in rows:
+                    _write_queue.task_done()
+                rows = []
+    except asyncio.CancelledError:
+        while not _write_queue.empty():
+            rows.append(_write_queue.get_nowait())
+        if rows:
+            try:
+                _write_summaries(rows)
+                logger.info(f"Saved {len(rows)} pending summaries to database on shutdown")
+            except Exception as e:
+                logger.exception("Error saving pending summaries on shutdown: %s", e)
+                _uncache_summaries(rows)
+            finally:
+                for _ in rows:
+                    _write_queue.task_done()
+        raise
+
+def _enqueue_summary(loop, url: str, summary_content: str):
+    """Queue a summary write on the running loop, starting the flush task if needed"""
+    global _write_queue, _write_queue_loop, _flush_task
+    if _write_queue_loop is not loop:
+        _write_queue = asyncio.Queue()
+        _write_queue_loop = loop
+        _flush_task = loop.create_task(_flush_writer())
+    _write_queue.put_nowait((url, summary_content))
+
+async def flush_pending_summaries():
+    """Wait until every queued summary has been committed to the database"""
+    if _write_queue is not None and _write_queue_loop is asyncio.get_running_loop():
+        await _write_queue.join()
 
 def save_summary_to_db(url: str, summary_content: str) -> bool:
     """
     Save a URL's summary to the database
     
+    When called from a running event loop the row is queued and committed with
+    the next batch; otherwise it is written immediately.
+    
     Args:
         url: The URL that was parsed
         summary_content: The extracted summary content
         
     Returns:
-        True if successful, False otherwise
+        True if the summary was saved or queued, False otherwise
     """
     logger.info(f"Saving summary to database for URL: {url}")
     # No need to format summary content as JSON as it's already a string
-    logger.info(f"Full summary content to save: {summary_content}")
+    logger.debug("Full summary content to save: %s", summary_content)
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
         
-        # Insert or replace the summary
-        cursor.execute(
-            "INSERT OR REPLACE INTO link_summaries (url, summary_content, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)",
-            (url, summary_content)
-        )
+        if loop is not None:
+            _enqueue_summary(loop, url, summary_content)
+            logger.info(f"Summary for {url} queued for saving to database")
+        else:
+            _write_summaries([(url, summary_content)])
+            logger.info(f"Summary for {url} successfully saved to database")
         
-        conn.commit()
-        logger.info(f"Summary for {url} successfully saved to database")
+        # Reads are served from the cache straight away, even before the batch is committed
+        _cache_summary(url, summary_content)
         return True
     except Exception as e:
-        logger.error(f"Error saving summary to database: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error saving summary to database: %s", e)
         return False
-    finally:
-        if conn:
-            logger.info("Closing database connection")
-            conn.close()
 
 # Define a global variable to track last API call time for rate limiting
 _last_api_call_time = 0
 _api_rate_limit_delay = 4  # seconds between API calls
 
-def _respect_rate_limit():
+async def _respect_rate_limit():
     """
     Helper function to implement rate limiting.
-    Sleeps if needed to ensure minimum delay between API calls.
+    Reserves the next free API slot before sleeping, so concurrent callers are
+    spaced _api_rate_limit_delay apart instead of all waking up together.
     """
     global _last_api_call_time
     current_time = time.time()
-    time_since_last_call = current_time - _last_api_call_time
+    if _last_api_call_time > 0:
+        slot = max(current_time, _last_api_call_time + _api_rate_limit_delay)
+    else:
+        slot = current_time
+    _last_api_call_time = slot
     
-    if time_since_last_call < _api_rate_limit_delay and _last_api_call_time > 0:
-        sleep_time = _api_rate_limit_delay - time_since_last_call
+    sleep_time = slot - current_time
+    if sleep_time > 0:
         logger.info(f"Rate limiting: Waiting {sleep_time:.2f} seconds before next API call")
-        time.sleep(sleep_time)
+        await asyncio.sleep(sleep_time)
+
+@functools.lru_cache(maxsize=None)
+def _make_strategy(instruction_type: str) -> LLMExtractionStrategy:
+    """Build the LLM extraction strategy for an instruction type once; callers work on copies"""
+    instruction_text, _ = _instruction_for(instruction_type)
+    return LLMExtractionStrategy(
+        llm_config = LLMConfig(provider="gemini/gemini-2.0-flash", api_token=_GEMINI_API_KEY),
+        schema=ARTICLE_SCHEMA,
+        extraction_type="schema",
+        instruction=instruction_text,
+        apply_chunking=False,
+        input_format="fit_markdown",   # pruned main content instead of the full page HTML
+        extra_args={"temperature": 0.0, "max_tokens": 2000}
+    )
+
+@functools.lru_cache(maxsize=None)
+def _make_crawl_config(instruction_type: str) -> CrawlerRunConfig:
+    """Build the crawler run config for an instruction type once; callers work on copies"""
+    return CrawlerRunConfig(
+        extraction_strategy=_make_strategy(instruction_type),
+        # Strip navigation, footers and other boilerplate before the page reaches Gemini
+        markdown_generator=DefaultMarkdownGenerator(
+            content_filter=PruningContentFilter(threshold=0.48, threshold_type="fixed")
+        ),
+        cache_mode=CacheMode.BYPASS,
+        simulate_user=True,
+    )
+
+def _build_crawl_config(url: str, instruction_type: str):
+    """
+    Return (llm_strategy, crawl_config) for one extraction.
     
-    _last_api_call_time = time.time()
+    Both are shallow copies of the cached per-instruction-type objects. The strategy
+    gets its own token usage counters so concurrent extractions don't share state,
+    and its instruction is formatted with the URL when the template asks for it.
+    """
+    instruction_text, is_templated = _instruction_for(instruction_type)
+    llm_strategy = copy.copy(_make_strategy(instruction_type))
+    llm_strategy.usages = []
+    llm_strategy.total_usage = TokenUsage()
+    if is_templated:
+        llm_strategy.instruction = instruction_text.format(url)
+    crawl_config = copy.copy(_make_crawl_config(instruction_type))
+    crawl_config.extraction_strategy = llm_strategy
+    return llm_strategy, crawl_config
+
+# Browser configuration shared by every pooled crawler
+BROWSER_CONFIG = BrowserConfig(
+    headless=True,
+    browser_type="firefox",
+    )
+
+# Error text reported when the underlying browser went away mid-crawl
+BROWSER_CLOSED_ERROR = "Target page, context or browser has been closed"
+
+class BrowserPool:
+    """
+    Pool of started AsyncWebCrawler instances that are handed out per extraction
+    instead of launching a new Firefox for every URL.
+    
+    Crawlers are created lazily up to `size`, reused through acquire/release and
+    closed by a background cleanup task once they have been idle longer than
+    `max_idle_time` seconds. Long-running browsers leak memory, so each crawler is
+    also recycled (closed and replaced) after `max_uses` extractions or once it is
+    older than `max_age` seconds.
+    """
+
+    def __init__(self, browser_config: BrowserConfig, size: int = 5, max_idle_time: float = 300, cleanup_interval: float = 60,
+                 max_uses: int = 100, max_age: float = 1800):
+        self.browser_config = browser_config
+        self.size = size
+        self.max_idle_time = max_idle_time
+        self.cleanup_interval = cleanup_interval
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.stats = {"created": 0, "reused": 0, "destroyed": 0, "recycled": 0}
+        self._use_counts = {}
+        self._created_at = {}
+        self._loop = None
+        self._idle = None
+        self._semaphore = None
+        self._cleanup_task = None
+
+    def _ensure_loop(self):
+        """Bind the pool's asyncio primitives to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._created_at:
+            # Crawlers started on a previous loop can neither be used nor closed from this one
+            raise RuntimeError("Browser pool is still bound to another event loop; call close() on that loop first")
+        self._loop = loop
+        self._use_counts.clear()
+        self._created_at.clear()
+        self._idle = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(self.size)
+        self._cleanup_task = loop.create_task(self._cleanup())
+
+    async def _make_crawler(self) -> AsyncWebCrawler:
+        """Launch a new browser and return the started crawler"""
+        crawler = AsyncWebCrawler(config=self.browser_config)
+        await crawler.start()
+        self._use_counts[crawler] = 0
+        self._created_at[crawler] = time.monotonic()
+        self.stats["created"] += 1
+        logger.info(f"Started pooled browser ({self.stats['created']} created so far)")
+        return crawler
+
+    async def _destroy(self, crawler: AsyncWebCrawler):
+        """Close a crawler, ignoring errors from an already dead browser"""
+        try:
+            await crawler.close()
+        except Exception as e:
+            logger.warning(f"Error closing pooled browser: {str(e)}")
+        self._use_counts.pop(crawler, None)
+        self._created_at.pop(crawler, None)
+        self.stats["destroyed"] += 1
+
+    async def warm_up(self, size: Optional[int] = None):
+        """Start up to `size` browsers ahead of time so the first extractions don't pay launch cost"""
+        self._ensure_loop()
+        count = min(size or self.size, self.size) - len(self._created_at)
+        if count <= 0:
+            return
+        crawlers = await asyncio.gather(*(self._make_crawler() for _ in range(count)), return_exceptions=True)
+        for crawler in crawlers:
+            if isinstance(crawler, Exception):
+                logger.warning(f"Failed to warm up browser: {str(crawler)}")
+            else:
+                self._idle.put_nowait((crawler, time.monotonic()))
+
+    async def acquire(self) -> AsyncWebCrawler:
+        """Take an idle crawler from the pool, launching a new one if none is available"""
+        self._ensure_loop()
+        await self._semaphore.acquire()
+        try:
+            if not self._idle.empty():
+                crawler, _ = self._idle.get_nowait()
+                self.stats["reused"] += 1
+            else:
+                crawler = await self._make_crawler()
+            self._use_counts[crawler] = self._use_counts.get(crawler, 0) + 1
+            return crawler
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    async def release(self, crawler: AsyncWebCrawler, discard: bool = False):
+        """
+        Return a crawler to the pool.
+        
+        Args:
+            crawler: The crawler obtained from acquire()
+            discard: Close the crawler instead of reusing it (e.g. after the browser crashed)
+        """
+        try:
+            if discard:
+                logger.warning("Discarding pooled browser")
+                await self._destroy(crawler)
+            elif self._needs_recycle(crawler):
+                logger.info(f"Recycling pooled browser after {self._use_counts.get(crawler, 0)} uses")
+                await self._destroy(crawler)
+                self.stats["recycled"] += 1
+                try:
+                    self._idle.put_nowait((await self._make_crawler(), time.monotonic()))
+                except Exception as e:
+                    # The next acquire() launches a browser on demand instead
+                    logger.warning(f"Failed to start replacement browser: {str(e)}")
+            else:
+                self._idle.put_nowait((crawler, time.monotonic()))
+        finally:
+            self._semaphore.release()
+
+    def _needs_recycle(self, crawler: AsyncWebCrawler) -> bool:
+        """Check whether a crawler has reached its use count or age limit"""
+        if self._use_counts.get(crawler, 0) >= self.max_uses:
+            return True
+        return time.monotonic() - self._created_at.get(crawler, time.monotonic()) > self.max_age
+
+    async def _cleanup(self):
+        """Periodically close crawlers that have been idle for longer than max_idle_time"""
+        while True:
+            await asyncio.sleep(self.cleanup_interval)
+            now = time.monotonic()
+            keep = []
+            while not self._idle.empty():
+                crawler, last_used = self._idle.get_nowait()
+                if now - last_used > self.max_idle_time:
+                    logger.info("Closing idle pooled browser")
+                    await self._destroy(crawler)
+                else:
+                    keep.append((crawler, last_used))
+            for item in keep:
+                self._idle.put_nowait(item)
+
+    async def close(self):
+        """Close every idle crawler and stop the cleanup task"""
+        if self._loop is None:
+            return
+        if self._cleanup_task:
+            self._cleanup_task.cancel()
+            self._cleanup_task = None
+        while not self._idle.empty():
+            crawler, _ = self._idle.get_nowait()
+            await self._destroy(crawler)
+        logger.info(f"Browser pool closed. Stats: {self.stats}")
+        self._loop = None
+
+# Shared pool used by extract_summary_from_link
+browser_pool = BrowserPool(BROWSER_CONFIG)
+
+@functools.lru_cache(maxsize=None)
+def _html_processor():
+    """Crawler that is never started, used only to run extraction on already fetched HTML"""
+    return AsyncWebCrawler(config=BROWSER_CONFIG)
 
 async def extract_summary(url: str, enable_retries: bool = False, debug_mode: bool = False) -> Dict[str, Any]:
     """
@@ -164,8 +546,13 @@ async def extract_summary(url: str, enable_retries: bool = False, debug_mode: bo
     logger.info(f"Starting extract_summary for URL: {url}")
     logger.info(f"Retry enabled: {enable_retries}, Debug mode: {debug_mode}")
     
-    # First, try to get the summary from the database
-    db_result = get_summary_from_db(url)
+    # First, try to get the summary from the in-memory cache, then from the database.
+    # The SQLite lookup runs in a worker thread so it doesn't block other extractions.
+    cached_content = _get_cached_summary(url)
+    if cached_content is not None:
+        db_result = {"content": cached_content}
+    else:
+        db_result = await asyncio.to_thread(get_summary_from_db, url)
     if db_result:
         logger.info(f"Found existing summary in database for URL: {url}")
         if "content" in db_result and db_result["content"]:
@@ -179,7 +566,7 @@ async def extract_summary(url: str, enable_retries: bool = False, debug_mode: bo
     logger.info(f"No summary in database, proceeding with web extraction using instruction type: {instruction_type}")
     
     # Apply rate limiting before extraction
-    _respect_rate_limit()
+    await _respect_rate_limit()
     
     # If retries are not enabled, just make a single attempt with browser retry
     if not enable_retries:
@@ -188,11 +575,13 @@ async def extract_summary(url: str, enable_retries: bool = False, debug_mode: bo
             # Use the new wrapper function instead of direct call
             result = await extract_with_browser_retry(url, instruction_type, debug_mode)
             logger.info(f"Extraction completed for URL: {url}")
-            logger.info(f"Extraction result: {format_json(result)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Extraction result: {format_json(result)}")
             
             # Process the result to extract content
             processed_result = process_extraction_result(result, url)
-            logger.info(f"Processed result: {format_json(processed_result)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Processed result: {format_json(processed_result)}")
             
             # If we got content, return it
             if processed_result["success"] == 1 and processed_result["content"]:
@@ -208,8 +597,7 @@ async def extract_summary(url: str, enable_retries: bool = False, debug_mode: bo
             return processed_result
             
         except Exception as e:
-            logger.error(f"Exception during extraction for URL {url}: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("Exception during extraction for URL %s: %s", url, e)
             return {"success": 0, "content": ""}
     
     # With retries enabled, use the retry logic
@@ -224,11 +612,12 @@ async def extract_summary(url: str, enable_retries: bool = False, debug_mode: bo
             
             # Apply rate limiting before each attempt
             if attempt > 0:
-                _respect_rate_limit()
+                await _respect_rate_limit()
                 
             # Use the new wrapper function instead of direct call
             result = await extract_with_browser_retry(url, instruction_type, debug_mode)
-            logger.info(f"Extraction result on attempt {attempt+1}: {format_json(result)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Extraction result on attempt {attempt+1}: {format_json(result)}")
             
             # Process the result
             processed_result = process_extraction_result(result, url)
@@ -241,22 +630,51 @@ async def extract_summary(url: str, enable_retries: bool = False, debug_mode: bo
             # If we got a result but it was not valid, retry if we have attempts left
             if attempt < max_attempts - 1:
                 logger.info(f"Invalid result on attempt {attempt+1}, retrying in {backoff_time} seconds")
-                time.sleep(backoff_time)
+                await asyncio.sleep(backoff_time)
                 backoff_time *= 1.5  # Exponential backoff
                 
         except Exception as e:
-            logger.error(f"Exception on attempt {attempt+1}: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("Exception on attempt %s: %s", attempt+1, e)
             if attempt < max_attempts - 1:
                 logger.info(f"Retrying in {backoff_time} seconds")
-                time.sleep(backoff_time)
+                await asyncio.sleep(backoff_time)
                 backoff_time *= 1.5
     
     # If we've exhausted all attempts
     logger.error(f"Failed to extract content after {max_attempts} attempts for URL: {url}")
     return {"success": 0, "content": ""}
 
-async def extract_summary_from_link(url: str, instruction_type: str = DEFAULT_INSTRUCTION, debug_mode: bool = False) -> Dict[str, Any]:
+async def extract_summaries(urls: List[str], concurrency: int = 8, enable_retries: bool = False, debug_mode: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract summaries for many URLs concurrently, with at most `concurrency` extractions in flight.
+    
+    Args:
+        urls: The URLs to extract content from (duplicates are extracted once)
+        concurrency: Maximum number of simultaneous extractions
+        enable_retries: Whether to enable retry logic for each extraction
+        debug_mode: Whether to enable LiteLLM debug mode
+        
+    Returns:
+        A dictionary mapping each URL to its extract_summary result
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    logger.info(f"Extracting summaries for {len(unique_urls)} URLs with concurrency {concurrency}")
+    semaphore = asyncio.Semaphore(concurrency)
+    if unique_urls:
+        await browser_pool.warm_up(min(concurrency, len(unique_urls)))
+
+    async def extract_one(url):
+        async with semaphore:
+            try:
+                return url, await extract_summary(url, enable_retries=enable_retries, debug_mode=debug_mode)
+            except Exception as e:
+                logger.exception("Exception during extraction for URL %s: %s", url, e)
+                return url, {"success": 0, "content": ""}
+
+    results = await asyncio.gather(*(extract_one(url) for url in unique_urls))
+    return dict(results)
+
+async def extract_summary_from_link(url: str, instruction_type: str = DEFAULT_INSTRUCTION, debug_mode: bool = False, html: Optional[str] = None) -> Dict[str, Any]:
     """
     Extract a summary from a given URL using specified instruction type.
     
@@ -264,6 +682,7 @@ async def extract_summary_from_link(url: str, instruction_type: str = DEFAULT_IN
         url: The URL to extract content from
         instruction_type: The type of instruction to use (default: "summary")
         debug_mode: Whether to enable LiteLLM debug mode
+        html: Already fetched page HTML; when given it is extracted directly and no browser is used
         
     Returns:
         A dictionary containing the extracted content
@@ -273,50 +692,16 @@ async def extract_summary_from_link(url: str, instruction_type: str = DEFAULT_IN
     logger.info(f"Debug mode: {debug_mode}")
     
     # Apply rate limiting
-    _respect_rate_limit()
+    await _respect_rate_limit()
     
     # Enable debug mode if requested
     if debug_mode:
         litellm._turn_on_debug()
         logger.info("LiteLLM debug mode enabled")
     
-    # Get the appropriate instruction
-    if instruction_type not in INSTRUCTIONS:
-        logger.warning(f"Instruction type '{instruction_type}' not found. Using default.")
-        instruction_text = INSTRUCTIONS[DEFAULT_INSTRUCTION]
-    else:
-        instruction_text = INSTRUCTIONS[instruction_type]
-    
-    # Format the instruction with the URL
-    instruction_text = instruction_text.format(url)
-    logger.info(f"Using instruction: {instruction_text}")
-
-    # 1. Define the LLM extraction strategy - keeping exact same settings
-    logger.info("Configuring LLM extraction strategy")
-    llm_strategy = LLMExtractionStrategy(
-        llm_config = LLMConfig(provider="gemini/gemini-2.0-flash", api_token=os.getenv('GEMINI_API_KEY')),
-        schema=Article.schema_json(), # Or use model_json_schema()
-        extraction_type="schema",
-        instruction=instruction_text,
-        apply_chunking=False,
-        input_format="html",   # or "html", "fit_markdown"
-        extra_args={"temperature": 0.0, "max_tokens": 2000}
-    )
-
-    # 2. Build the crawler config
-    logger.info("Configuring crawler run config")
-    crawl_config = CrawlerRunConfig(
-        extraction_strategy=llm_strategy,
-        cache_mode=CacheMode.BYPASS,
-        simulate_user=True,
-    )
-
-    # 3. Create a browser config
-    logger.info("Configuring browser")
-    browser_cfg = BrowserConfig(
-        headless=True,
-        browser_type="firefox",
-        )
+    # 1-2. Get the LLM extraction strategy and crawler config for this instruction type
+    llm_strategy, crawl_config = _build_crawl_config(url, instruction_type)
+    logger.debug("Using instruction: %s", llm_strategy.instruction)
 
     # Define retry parameters for Gemini API errors
     max_gemini_retries = 3
@@ -325,93 +710,114 @@ async def extract_summary_from_link(url: str, instruction_type: str = DEFAULT_IN
 
     while True:
         try:
-            logger.info(f"Starting crawl for URL: {url}")
-            async with AsyncWebCrawler(config=browser_cfg) as crawler:
-                # 4. Crawl the page
-                logger.info("Executing crawler run")
-                result = await crawler.arun(
+            if html is not None:
+                # 3-4. Scrape and extract the fetched HTML without taking a browser from the pool
+                logger.info(f"Extracting from fetched HTML for URL: {url}")
+                result = await _html_processor().aprocess_html(
                     url=url,
-                    config=crawl_config
+                    html=html,
+                    extracted_content=None,
+                    config=crawl_config,
+                    screenshot=None,
+                    pdf_data=None,
+                    verbose=False,
                 )
+            else:
+                logger.info(f"Starting crawl for URL: {url}")
+                # 3. Borrow a running browser from the pool
+                crawler = await browser_pool.acquire()
+                discard_crawler = False
+                try:
+                    # 4. Crawl the page
+                    logger.info("Executing crawler run")
+                    result = await crawler.arun(url=url, config=crawl_config)
+                    # A crashed browser is not worth returning to the pool
+                    discard_crawler = not result.success and BROWSER_CLOSED_ERROR in (result.error_message or "")
+                except Exception:
+                    discard_crawler = True
+                    raise
+                finally:
+                    await browser_pool.release(crawler, discard=discard_crawler)
 
-                logger.warning(f"Result: {result.success}")
+            logger.warning(f"Result: {result.success}")
 
-                if result.success:
-                    # 5. Return the extracted content
-                    logger.info(f"Crawl successful for URL: {url}")
-                    data = json.loads(result.extracted_content)
-                    logger.info(f"Extracted content: {format_json(data)}")
-                    
-                    # Check if the content contains any error message 
-                    # This happens when the crawler successfully runs but there's an error in extraction
-                    extraction_error_found = False
-                    retry_for_error = False
-                    
-                    if isinstance(data, list) and len(data) > 0:
-                        for item in data:
-                            if isinstance(item, dict) and item.get("error") is True:
-                                content = item.get("content", "")
-                                
-                                # Case 1: Check for Gemini API error 499
-                                if isinstance(content, str) and "GeminiException" in content and "code\": 499" in content and "The operation was cancelled" in content:
-                                    logger.warning("Detected Gemini API error 499 in successful crawler response")
-                                    extraction_error_found = True
-                                    retry_for_error = gemini_retry_count < max_gemini_retries
-                                    if retry_for_error:
-                                        gemini_retry_count += 1
-                                        logger.warning(f"Gemini API error 499 (operation cancelled) encountered. Retry {gemini_retry_count}/{max_gemini_retries}")
-                                        logger.warning(f"Waiting {gemini_retry_delay} seconds before retrying...")
-                                        time.sleep(gemini_retry_delay)
-                                        gemini_retry_delay *= 2  # Exponential backoff
-                                    else:
-                                        logger.error(f"Exceeded maximum retries ({max_gemini_retries}) for Gemini API error 499")
-                                
-                                # Case 2: Check for 'list' object has no attribute 'usage' error
-                                elif isinstance(content, str) and "'list' object has no attribute 'usage'" in content:
-                                    logger.warning("Detected 'list' object has no attribute 'usage' error in successful crawler response")
-                                    extraction_error_found = True
-                                    retry_for_error = gemini_retry_count < max_gemini_retries
-                                    if retry_for_error:
-                                        gemini_retry_count += 1
-                                        logger.warning(f"'list' usage attribute error encountered. Retry {gemini_retry_count}/{max_gemini_retries}")
-                                        logger.warning(f"Waiting {gemini_retry_delay} seconds before retrying...")
-                                        time.sleep(gemini_retry_delay)
-                                        gemini_retry_delay *= 2  # Exponential backoff
-                                    else:
-                                        logger.error(f"Exceeded maximum retries ({max_gemini_retries}) for 'list' usage attribute error")
-                                
-                                # Case 3: Any other error that might need retrying
-                                elif extraction_error_found == False:
-                                    logger.warning(f"Detected unknown error in successful crawler response: {content}")
-                                    extraction_error_found = True
-                    
-                    # If a retryable error was found and we still have retries left, try again
-                    if extraction_error_found and retry_for_error:
-                        # Apply rate limiting before retry
-                        _respect_rate_limit()
-                        continue
-                    
-                    # Add the URL to the result for use in the processing function
-                    if isinstance(data, dict):
-                        data["url"] = url
-                    elif isinstance(data, list):
-                        for item in data:
-                            if isinstance(item, dict):
-                                item["url"] = url
-                    
-                    # Safely show usage stats if available - wrap in try/except to catch any attribute errors
-                    try:
-                        llm_strategy.show_usage()
-                    except AttributeError as e:
-                        logger.warning(f"Could not show usage statistics: {str(e)}")
-                    except Exception as e:
-                        logger.warning(f"Unexpected error showing usage statistics: {str(e)}")
-                    
-                    return data
-                else:
-                    logger.error(f"Crawl failed for URL: {url}")
-                    logger.error(f"Error message: {result.error_message}")
-                    return {"error": result.error_message}
+            if result.success:
+                # 5. Return the extracted content
+                logger.info(f"Crawl successful for URL: {url}")
+                data = json.loads(result.extracted_content)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Extracted content: {format_json(data)}")
+                
+                # Check if the content contains any error message 
+                # This happens when the crawler successfully runs but there's an error in extraction
+                extraction_error_found = False
+                retry_for_error = False
+                
+                if isinstance(data, list) and len(data) > 0:
+                    for item in data:
+                        if not isinstance(item, dict):
+                            continue
+                        # Add the URL to each item for use in the processing function
+                        item["url"] = url
+                        if item.get("error") is True:
+                            content = item.get("content", "")
+                            
+                            # Case 1: Check for Gemini API error 499
+                            if isinstance(content, str) and "GeminiException" in content and "code\": 499" in content and "The operation was cancelled" in content:
+                                logger.warning("Detected Gemini API error 499 in successful crawler response")
+                                extraction_error_found = True
+                                retry_for_error = gemini_retry_count < max_gemini_retries
+                                if retry_for_error:
+                                    gemini_retry_count += 1
+                                    logger.warning(f"Gemini API error 499 (operation cancelled) encountered. Retry {gemini_retry_count}/{max_gemini_retries}")
+                                    logger.warning(f"Waiting {gemini_retry_delay} seconds before retrying...")
+                                    await asyncio.sleep(gemini_retry_delay)
+                                    gemini_retry_delay *= 2  # Exponential backoff
+                                else:
+                                    logger.error(f"Exceeded maximum retries ({max_gemini_retries}) for Gemini API error 499")
+                            
+                            # Case 2: Check for 'list' object has no attribute 'usage' error
+                            elif isinstance(content, str) and "'list' object has no attribute 'usage'" in content:
+                                logger.warning("Detected 'list' object has no attribute 'usage' error in successful crawler response")
+                                extraction_error_found = True
+                                retry_for_error = gemini_retry_count < max_gemini_retries
+                                if retry_for_error:
+                                    gemini_retry_count += 1
+                                    logger.warning(f"'list' usage attribute error encountered. Retry {gemini_retry_count}/{max_gemini_retries}")
+                                    logger.warning(f"Waiting {gemini_retry_delay} seconds before retrying...")
+                                    await asyncio.sleep(gemini_retry_delay)
+                                    gemini_retry_delay *= 2  # Exponential backoff
+                                else:
+                                    logger.error(f"Exceeded maximum retries ({max_gemini_retries}) for 'list' usage attribute error")
+                            
+                            # Case 3: Any other error that might need retrying
+                            elif extraction_error_found == False:
+                                logger.warning(f"Detected unknown error in successful crawler response: {content}")
+                                extraction_error_found = True
+                
+                # If a retryable error was found and we still have retries left, try again
+                if extraction_error_found and retry_for_error:
+                    # Apply rate limiting before retry
+                    await _respect_rate_limit()
+                    continue
+                
+                # Add the URL to a single-object result (list items were tagged above)
+                if isinstance(data, dict):
+                    data["url"] = url
+                
+                # Safely show usage stats if available - wrap in try/except to catch any attribute errors
+                try:
+                    llm_strategy.show_usage()
+                except AttributeError as e:
+                    logger.warning(f"Could not show usage statistics: {str(e)}")
+                except Exception as e:
+                    logger.warning(f"Unexpected error showing usage statistics: {str(e)}")
+                
+                return data
+            else:
+                logger.error(f"Crawl failed for URL: {url}")
+                logger.error(f"Error message: {result.error_message}")
+                return {"error": result.error_message}
         except litellm.APIConnectionError as e:
             error_str = str(e)
             
@@ -439,10 +845,10 @@ async def extract_summary_from_link(url: str, instruction_type: str = DEFAULT_IN
                     gemini_retry_delay *= 2  # Exponential backoff if we couldn't extract the value
                 
                 logger.warning(f"Waiting {gemini_retry_delay} seconds before retrying...")
-                time.sleep(gemini_retry_delay)
+                await asyncio.sleep(gemini_retry_delay)
                 
                 # Apply rate limiting before retry
-                _respect_rate_limit() 
+                await _respect_rate_limit() 
                 continue  # Try again
             
             # Check if it's the specific Gemini error 499 (operation cancelled)
@@ -450,10 +856,10 @@ async def extract_summary_from_link(url: str, instruction_type: str = DEFAULT_IN
                 gemini_retry_count += 1
                 logger.warning(f"Gemini API error 499 (operation cancelled) encountered. Retry {gemini_retry_count}/{max_gemini_retries}")
                 logger.warning(f"Waiting {gemini_retry_delay} seconds before retrying...")
-                time.sleep(gemini_retry_delay)
+                await asyncio.sleep(gemini_retry_delay)
                 gemini_retry_delay *= 2  # Exponential backoff
                 # Apply rate limiting before retry
-                _respect_rate_limit() 
+                await _respect_rate_limit() 
                 continue  # Try again
             else:
                 # Either it's a different error or we've exceeded retries
@@ -469,14 +875,13 @@ async def extract_summary_from_link(url: str, instruction_type: str = DEFAULT_IN
                 gemini_retry_count += 1
                 logger.warning(f"'list' usage attribute error encountered. Retry {gemini_retry_count}/{max_gemini_retries}")
                 logger.warning(f"Waiting {gemini_retry_delay} seconds before retrying...")
-                time.sleep(gemini_retry_delay)
+                await asyncio.sleep(gemini_retry_delay)
                 gemini_retry_delay *= 2  # Exponential backoff
                 # Apply rate limiting before retry
-                _respect_rate_limit()
+                await _respect_rate_limit()
                 continue  # Try again
             else:
-                logger.error(f"Exception during crawl for URL {url}: {str(e)}")
-                logger.error(traceback.format_exc())
+                logger.exception("Exception during crawl for URL %s: %s", url, e)
                 return {"error": str(e)}
 
 def process_extraction_result(result: Any, url: str = None) -> Dict[str, Any]:
@@ -495,68 +900,85 @@ def process_extraction_result(result: Any, url: str = None) -> Dict[str, Any]:
         - success: 1 if successful, 0 if error
         - content: The extracted content as a string
     """
-    logger.info(f"Processing extraction result: {format_json(result)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Processing extraction result: {format_json(result)}")
     final_content = ""
     success = 0
     
     try:
-        # Check for specific error patterns in list results
-        if isinstance(result, list):
-            # Case 1: Check for Gemini API error 499
-            gemini_error_items = []
-            usage_error_items = []
-            general_error_items = []
+        # Fast path: a single valid chunk (the usual case without chunking)
+        if (isinstance(result, list) and len(result) == 1 and isinstance(result[0], dict)
+                and result[0].get("error") is False and isinstance(result[0].get("summarized_content"), str)):
+            item = result[0]
+            final_content = item["summarized_content"]
+            if url is None:
+                url = item.get("url")
+            logger.info(f"Selected single valid item ({len(final_content)} chars)")
+            logger.debug("Selected content: %s", final_content)
+            success = 1
+        
+        # Handle JSON array format (from schema extraction)
+        elif isinstance(result, list):
+            # Single pass over the parsed items: classify error items and keep the
+            # item with error=false and the longest summarized_content
+            gemini_error_count = 0
+            usage_error_count = 0
+            general_error_count = 0
+            first_general_error = None
+            longest_item = None
+            longest_len = -1
+            valid_count = 0
             
             for item in result:
-                if isinstance(item, dict) and item.get("error") is True:
+                if not isinstance(item, dict):
+                    continue
+                error = item.get("error")
+                if error is True:
                     content = item.get("content", "")
                     if isinstance(content, str):
                         if "GeminiException" in content and "code\": 499" in content:
-                            gemini_error_items.append(item)
+                            gemini_error_count += 1
                         elif "'list' object has no attribute 'usage'" in content:
-                            usage_error_items.append(item)
+                            usage_error_count += 1
                         else:
-                            general_error_items.append(item)
+                            general_error_count += 1
+                            if first_general_error is None:
+                                first_general_error = item
+                elif error is False:
+                    content = item.get("summarized_content")
+                    if not isinstance(content, str):
+                        continue
+                    valid_count += 1
+                    if len(content) > longest_len:
+                        longest_len = len(content)
+                        longest_item = item
             
             # Handle Gemini API error 499
-            if len(gemini_error_items) > 0 and len(gemini_error_items) == len(result):
+            if gemini_error_count > 0 and gemini_error_count == len(result):
                 logger.warning(f"All items in result list contain Gemini API error 499")
                 return {"success": 0, "content": "", "error": "Gemini API error 499 (operation cancelled)"}
             
             # Handle 'list' usage attribute error
-            if len(usage_error_items) > 0 and len(usage_error_items) == len(result):
+            if usage_error_count > 0 and usage_error_count == len(result):
                 logger.warning(f"All items in result list contain 'list' usage attribute error")
                 return {"success": 0, "content": "", "error": "Error: 'list' object has no attribute 'usage'"}
             
             # Handle general errors when all items have errors
-            if len(general_error_items) > 0 and len(general_error_items) + len(gemini_error_items) + len(usage_error_items) == len(result):
-                error_message = general_error_items[0].get("content", "Unknown error")
+            if general_error_count > 0 and general_error_count + gemini_error_count + usage_error_count == len(result):
+                error_message = first_general_error.get("content", "Unknown error")
                 logger.warning(f"All items in result list contain errors. First error: {error_message}")
                 return {"success": 0, "content": "", "error": f"Error: {error_message}"}
-        
-        # Handle JSON array format (from schema extraction)
-        if isinstance(result, list):
-            # Filter items where error is false
-            valid_items = [item for item in result 
-                          if isinstance(item, dict) 
-                          and item.get("error") is False
-                          and "summarized_content" in item]
             
-            logger.info(f"Found {len(valid_items)} valid items with error=false")
+            logger.info(f"Found {valid_count} valid items with error=false")
             
-            if valid_items:
-                # Find the item with the longest summarized_content
-                longest_item = max(valid_items, 
-                                   key=lambda x: len(x.get("summarized_content", "")) 
-                                   if isinstance(x.get("summarized_content"), str) else 0)
-                
-                final_content = longest_item.get("summarized_content", "")
+            if longest_item is not None:
+                final_content = longest_item["summarized_content"]
                 # Get the URL from the item if available
                 if url is None and "url" in longest_item:
                     url = longest_item["url"]
                     
                 logger.info(f"Selected item with longest summarized_content ({len(final_content)} chars)")
-                logger.info(f"Selected content: {final_content}")
+                logger.debug("Selected content: %s", final_content)
                 success = 1
         
         # Handle dict with summarized_content key
@@ -596,14 +1018,139 @@ def process_extraction_result(result: Any, url: str = None) -> Dict[str, Any]:
         return {"success": success, "content": final_content}
         
     except Exception as e:
-        logger.error(f"Error processing extraction result: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error processing extraction result: %s", e)
         return {"success": 0, "content": ""}
 
+# Plain HTTP fetch used as the cheap first step before loading the page in a browser
+_HTTP_FETCH_TIMEOUT = 20  # seconds
+_HTTP_MAX_RATE_LIMIT_RETRIES = 2
+_HTTP_MAX_RETRY_AFTER = 60  # seconds; longer Retry-After values end the attempt instead of waiting
+_HTTP_STOP_STATUSES = {404, 405, 410}  # the page is gone; a browser won't do better
+_HTTP_FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+
+async def _fetch_html(url: str):
+    """
+    Fetch a page with aiohttp, without a browser.
+    
+    Args:
+        url: The URL to fetch
+        
+    Returns:
+        A tuple (html, stop_error):
+        - html: The page HTML, or None if the browser should be tried instead (e.g. 403 bot blocks)
+        - stop_error: An error message when the status means no strategy will succeed (404/405/410, 5xx, repeated 429)
+    """
+    backoff_time = 2
+    timeout = aiohttp.ClientTimeout(total=_HTTP_FETCH_TIMEOUT)
+    try:
+        async with aiohttp.ClientSession(headers=_HTTP_FETCH_HEADERS, timeout=timeout) as session:
+            for attempt in range(_HTTP_MAX_RATE_LIMIT_RETRIES + 1):
+                async with session.get(url, allow_redirects=True) as response:
+                    status = response.status
+                    if status < 400:
+                        if "html" not in response.headers.get("Content-Type", "html"):
+                            logger.info(f"HTTP fetch returned non-HTML content for {url}, falling back to browser")
+                            return None, None
+                        return await response.text(errors="replace"), None
+                    
+                    # Rate limited: let other requests to this host back off too, and
+                    # retry the same cheap strategy with backoff
+                    if status == 429:
+                        retry_after = response.headers.get("Retry-After", "")
+                        wait_time = int(retry_after) if retry_after.isdigit() else backoff_time
+                        # Never hold the host back (or this link's semaphore slot) for longer than the cap
+                        _defer_host(url, min(wait_time, _HTTP_MAX_RETRY_AFTER))
+                        if wait_time > _HTTP_MAX_RETRY_AFTER:
+                            logger.warning(f"HTTP 429 for {url} with Retry-After {wait_time}s, not waiting")
+                            return None, f"HTTP error 429 (rate limited, retry after {wait_time}s)"
+                        if attempt < _HTTP_MAX_RATE_LIMIT_RETRIES:
+                            logger.warning(f"HTTP 429 for {url}, retrying in {wait_time} seconds")
+                            await asyncio.sleep(wait_time)
+                            backoff_time *= 2
+                            continue
+                        # The host is still backing off, so the browser would only be rate limited too
+                        logger.warning(f"HTTP 429 for {url} after {_HTTP_MAX_RATE_LIMIT_RETRIES} retries, not retrying with browser")
+                        return None, f"HTTP error 429 (rate limited, retry after {wait_time}s)"
+                    
+                    if status in _HTTP_STOP_STATUSES or status >= 500:
+                        logger.warning(f"HTTP {status} for {url}, not retrying with browser")
+                        return None, f"HTTP error {status}"
+                    
+                    # 403 and other client errors are usually bot protection the browser can get past
+                    logger.info(f"HTTP {status} for {url}, falling back to browser")
+                    return None, None
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.warning(f"HTTP fetch failed for {url}: {str(e)}, falling back to browser")
+    return None, None
+
+# Error markers checked on extraction results in the retry loop
+_BROWSER_CLOSED_SENTINEL = "BrowserType.launch: " + BROWSER_CLOSED_ERROR
+_GEMINI_SENTINEL = "Gemini API error"
+
+def _error_str(result: Any) -> str:
+    """Return the result's error message if it is a dict with a string error, otherwise an empty string"""
+    if isinstance(result, dict):
+        error = result.get("error")
+        return error if isinstance(error, str) else ""
+    return ""
+
+def _has_summary(result: Any) -> bool:
+    """Check whether an extraction result contains at least one non-empty summarized_content"""
+    items = result if isinstance(result, list) else [result]
+    return any(
+        isinstance(item, dict) and item.get("error") is False
+        and isinstance(item.get("summarized_content"), str) and item["summarized_content"]
+        for item in items
+    )
+
+# Per-host politeness: bounded concurrency, a random delay between requests and
+# a back-off window set when a host answers 429
+_HOST_CONCURRENCY = 2
+_HOST_REQUEST_DELAY = (0.5, 2.0)  # seconds, randomized before each request
+_host_semaphores = defaultdict(lambda: asyncio.Semaphore(_HOST_CONCURRENCY))
+_host_next_allowed = {}
+
+def _defer_host(url: str, delay: float):
+    """Hold back further requests to the URL's host for `delay` seconds"""
+    host = urlparse(url).netloc
+    _host_next_allowed[host] = max(_host_next_allowed.get(host, 0), time.monotonic() + delay)
+
+async def _wait_for_host(host: str):
+    """Wait out any back-off window for the host, then add a small randomized delay"""
+    wait_time = _host_next_allowed.get(host, 0) - time.monotonic()
+    if wait_time > 0:
+        logger.info(f"Host {host} is rate limited, waiting {wait_time:.2f} seconds")
+        await asyncio.sleep(wait_time)
+    await asyncio.sleep(random.uniform(*_HOST_REQUEST_DELAY))
+
 async def extract_with_browser_retry(url: str, instruction_type: str, debug_mode: bool) -> Dict[str, Any]:
     """
-    Wrapper function that attempts extraction and handles browser closed errors by
-    retrying multiple times with waits between attempts.
+    Wrapper function that limits concurrent extractions per host and spaces out
+    requests to the same host before running the extraction strategies.
+    
+    Args:
+        url: The URL to extract content from
+        instruction_type: The type of instruction to use
+        debug_mode: Whether to enable LiteLLM debug mode
+        
+    Returns:
+        The extraction result
+    """
+    host = urlparse(url).netloc
+    async with _host_semaphores[host]:
+        await _wait_for_host(host)
+        return await _extract_with_fallbacks(url, instruction_type, debug_mode)
+
+async def _extract_with_fallbacks(url: str, instruction_type: str, debug_mode: bool) -> Dict[str, Any]:
+    """
+    Try the cheapest extraction strategy first: the page is fetched over plain HTTP
+    and summarized without browser navigation. Only when that is blocked or yields
+    no summary does it load the page in a browser, handling browser closed errors
+    by retrying multiple times with waits between attempts.
     
     Args:
         url: The URL to extract content from
@@ -615,26 +1162,45 @@ async def extract_with_browser_retry(url: str, instruction_type: str, debug_mode
     """
     logger.info(f"Attempting extraction with browser retry for URL: {url}")
     
+    # Step 1: plain HTTP fetch, no page load in the browser
+    html, stop_error = await _fetch_html(url)
+    if stop_error:
+        return {"error": stop_error}
+    if html:
+        try:
+            result = await extract_summary_from_link(url, instruction_type, debug_mode, html=html)
+            if _has_summary(result):
+                logger.info(f"Extracted summary from plain HTTP fetch for URL: {url}")
+                return result
+            if _GEMINI_SENTINEL in _error_str(result):
+                logger.info("Gemini API error already handled in extract_summary_from_link, passing through")
+                return result
+            logger.info(f"No summary from plain HTTP fetch for URL: {url}, falling back to browser")
+        except Exception as e:
+            logger.exception("Exception during HTTP-first extraction for URL %s: %s", url, e)
+    
+    # Step 2: full browser crawl for JS-rendered or bot-protected pages
     max_browser_retries = 3
     for retry_num in range(max_browser_retries):
         try:
             # Apply rate limiting before each retry attempt after the first one
             if retry_num > 0:
-                _respect_rate_limit()
+                await _respect_rate_limit()
                 
             result = await extract_summary_from_link(url, instruction_type, debug_mode)
             
             # Check for the specific browser error
-            if isinstance(result, dict) and isinstance(result.get("error"), str) and "BrowserType.launch: Target page, context or browser has been closed" in result.get("error", ""):
+            error = _error_str(result)
+            if _BROWSER_CLOSED_SENTINEL in error:
                 if retry_num < max_browser_retries - 1:
                     logger.warning(f"Detected browser closed error, retry {retry_num+1}/{max_browser_retries}, waiting 5 seconds before retrying")
-                    time.sleep(10)
+                    await asyncio.sleep(10)
                     continue
                 else:
                     logger.error(f"Exhausted all {max_browser_retries} browser retries for URL: {url}")
             
             # Check for Gemini API error - we already handled retries in extract_summary_from_link
-            if isinstance(result, dict) and isinstance(result.get("error"), str) and "Gemini API error" in result.get("error", ""):
+            if _GEMINI_SENTINEL in error:
                 logger.info("Gemini API error already handled in extract_summary_from_link, passing through")
                 return result
             
@@ -643,13 +1209,11 @@ async def extract_with_browser_retry(url: str, instruction_type: str, debug_mode
             
         except Exception as e:
             if retry_num < max_browser_retries - 1:
-                logger.error(f"Exception during extraction retry {retry_num+1}/{max_browser_retries}: {str(e)}")
-                logger.error(traceback.format_exc())
+                logger.exception("Exception during extraction retry %s/%s: %s", retry_num+1, max_browser_retries, e)
                 logger.info(f"Waiting 5 seconds before retry attempt {retry_num+2}")
-                time.sleep(5)
+                await asyncio.sleep(5)
             else:
-                logger.error(f"Exception on final browser retry attempt: {str(e)}")
-                logger.error(traceback.format_exc())
+                logger.exception("Exception on final browser retry attempt: %s", e)
                 return {"error": str(e)}
     
     # This should not happen but just in case
@@ -689,15 +1253,22 @@ if __name__ == "__main__":
         enable_retries = False
         logger.info(f"Retry mode: {enable_retries}")
         
+        async def run_extraction():
+            try:
+                return await extract_summary(url, enable_retries=enable_retries, debug_mode=debug_mode)
+            finally:
+                await flush_pending_summaries()
+                await browser_pool.close()
+
         # Run the async function
-        summary = asyncio.run(extract_summary(url, enable_retries=enable_retries, debug_mode=debug_mode))
+        summary = asyncio.run(run_extraction())
         logger.info("Summary extraction complete")
-        logger.info(f"Full summary result: {format_json(summary)}")
-        print(json.dumps(summary, indent=2))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Full summary result: {format_json(summary)}")
+        print(orjson.dumps(summary, option=orjson.OPT_INDENT_2).decode())
         
-        # Ensure logs are flushed
-        for handler in logger.handlers:
-            handler.flush()
+        # Ensure queued logs are written before exiting
+        stop_logging()
             
     else:
         logger.info("No URL provided, showing usage information")
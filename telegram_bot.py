@@ -1,11 +1,20 @@
 import os
+import sys
 import logging
 from dotenv import load_dotenv
-from telethon import TelegramClient
+import aiohttp
 import asyncio
-from datetime import datetime
+import html
+import re
+import time
 from functools import partial
 
+# Optional faster event loop for the bot thread
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Load environment variables
 load_dotenv()
 
@@ -13,62 +22,243 @@ load_dotenv()
 logger = logging.getLogger('telegram_bot')
 logger.setLevel(logging.INFO)
 
-# Telegram API credentials from environment variables
-API_ID = int(os.getenv("TELEGRAM_API_ID"))
-API_HASH = os.getenv("TELEGRAM_API_HASH")
+# Telegram bot credentials from environment variables
 BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")  # You need to create a bot with BotFather and add this
-ADMIN_CHAT_ID = os.getenv("TELEGRAM_ADMIN_CHAT_ID")  # Your chat ID to receive notifications
+# Your chat ID to receive notifications, parsed once; None disables notifications
+ADMIN_CHAT_ID = int(os.getenv("TELEGRAM_ADMIN_CHAT_ID") or 0) or None
 
-# Create the client
-bot = TelegramClient('bot_session', API_ID, API_HASH)
+# The bot only sends messages to the admin chat, so it talks to the Bot API over
+# one pooled HTTPS session instead of keeping a full MTProto client
+BOT_API_URL = f"https://api.telegram.org/bot{BOT_TOKEN}"
+FLOOD_SLEEP_THRESHOLD = 60  # seconds; wait out shorter rate limits and retry once
+session = None
 bot_loop = None
 
+# Ping the API while idle so notifications reuse a live connection
+KEEPALIVE_INTERVAL = 240  # seconds
+_keepalive_task = None
+
+def _now_str():
+    """Current local time as shown in notifications"""
+    return time.strftime('%Y-%m-%d %H:%M:%S')
+
+# Telegram rejects messages longer than this
+TELEGRAM_MESSAGE_LIMIT = 4096
+# Cap concurrent sends to stay under Telegram's ~30 messages/second bot limit
+_send_semaphore = asyncio.Semaphore(25)
+
+async def _bot_api(method, payload=None):
+    """
+    Call a Bot API method on the shared session.
+
+    Returns:
+        The method's result
+
+    Raises:
+        RuntimeError if Telegram reports an error
+    """
+    for attempt in range(2):
+        async with session.post(f"{BOT_API_URL}/{method}", json=payload or {}) as response:
+            data = await response.json(content_type=None)
+        if data.get("ok"):
+            return data["result"]
+        retry_after = data.get("parameters", {}).get("retry_after")
+        if attempt == 0 and retry_after is not None and retry_after <= FLOOD_SLEEP_THRESHOLD:
+            logger.warning(f"Telegram rate limit on {method}, retrying in {retry_after} seconds")
+            await asyncio.sleep(retry_after)
+            continue
+        raise RuntimeError(f"Telegram {method} failed: {data.get('description', data)}")
+
+def _to_html(message):
+    """Render the **bold** markup used in notifications as Bot API HTML, escaping everything else"""
+    return re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", html.escape(message, quote=False), flags=re.S)
+
+# Chat and parse mode are the same for every notification
+_SEND_MESSAGE_DEFAULTS = {"chat_id": ADMIN_CHAT_ID, "parse_mode": "HTML"}
+
+async def _send_admin_message(message):
+    """Send a message to the admin chat, bounded by the send semaphore"""
+    async with _send_semaphore:
+        await _bot_api("sendMessage", {**_SEND_MESSAGE_DEFAULTS, "text": _to_html(message)})
+
+async def notify_many(messages):
+    """Send several messages to the admin chat concurrently"""
+    if ADMIN_CHAT_ID is None:
+        logger.warning("No admin chat ID configured for notifications")
+        return
+
+    await asyncio.gather(*(_send_admin_message(message) for message in messages))
+    logger.info(f"Sent {len(messages)} notifications")
+
+def _split_message(message, limit=TELEGRAM_MESSAGE_LIMIT):
+    """Split a message into parts of at most `limit` characters, breaking on line boundaries"""
+    parts = []
+    current = ""
+    for line in message.splitlines(keepends=True):
+        if current and len(current) + len(line) > limit:
+            parts.append(current)
+            current = ""
+        # A single line longer than the limit is cut into fixed-size pieces
+        while len(line) > limit:
+            parts.append(line[:limit])
+            line = line[limit:]
+        current += line
+    if current:
+        parts.append(current)
+    return parts
+
+async def _send_long_message(message):
+    """Send a message that may exceed Telegram's limit as ordered parts, one after another"""
+    if ADMIN_CHAT_ID is None:
+        logger.warning("No admin chat ID configured for notifications")
+        return
+
+    parts = _split_message(message)
+    for part in parts:
+        await _send_admin_message(part)
+    logger.info(f"Sent notification in {len(parts)} part(s)")
+
+# Notifications are queued and a single worker coalesces those arriving within
+# NOTIFY_BATCH_WINDOW into one message, so bursts don't hit Telegram's rate limits
+NOTIFY_BATCH_WINDOW = 0.5  # seconds
+NOTIFY_QUEUE_SIZE = 1000
+NOTIFY_SEPARATOR = "\n---\n"
+notify_queue = None
+_notify_worker_task = None
+
+async def _enqueue_notification(text):
+    """Queue a notification for the worker, or send it directly if the worker isn't running"""
+    if notify_queue is None:
+        await _send_long_message(text)
+    else:
+        await notify_queue.put(text)
+
+async def _notification_worker():
+    """Collect queued notifications for a short window and send them as one message"""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await notify_queue.get()]
+        deadline = loop.time() + NOTIFY_BATCH_WINDOW
+        while True:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(notify_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        try:
+            await _send_long_message(NOTIFY_SEPARATOR.join(batch))
+        except Exception as e:
+            logger.error(f"Failed to send {len(batch)} queued notifications: {e}")
+        finally:
+            for _ in batch:
+                notify_queue.task_done()
+
+# Strong references to scheduled notification tasks so they are not garbage collected mid-send
+_pending_notifications = set()
+# Hands a coroutine to the bot loop from any thread; bound by init_bot()
+_submit = None
+
+async def _run_notification(coro, description):
+    """Await a notification coroutine, logging any failure instead of raising"""
+    try:
+        await coro
+    except Exception as e:
+        logger.error(f"Failed to send {description} notification: {e}")
+
+def _start_notification(coro):
+    """Create the notification task; runs on the bot loop"""
+    task = asyncio.ensure_future(coro)
+    _pending_notifications.add(task)
+    task.add_done_callback(_pending_notifications.discard)
+
+def _schedule(coro, description):
+    """
+    Schedule a notification coroutine on the bot loop from another thread and return immediately.
+
+    Returns:
+        True if the notification was scheduled, False if the bot loop is not running
+    """
+    if _submit is not None:
+        notification = _run_notification(coro, description)
+        try:
+            _submit(notification)
+            return True
+        except RuntimeError:  # the bot loop has been closed
+            notification.close()
+    coro.close()
+    logger.error("Bot loop is not running, cannot send notification")
+    return False
+
+async def _keepalive():
+    """Periodically call getMe to keep the pooled HTTPS connection warm"""
+    while True:
+        await asyncio.sleep(KEEPALIVE_INTERVAL)
+        try:
+            await _bot_api("getMe")
+        except Exception as e:
+            logger.warning(f"Telegram keepalive ping failed: {e}")
+
 async def start_bot():
     """Start the bot and set up event handlers"""
-    await bot.start(bot_token=BOT_TOKEN)
-    logger.info("Telegram notification bot started")
+    global session, _keepalive_task, notify_queue, _notify_worker_task
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=300),
+        timeout=aiohttp.ClientTimeout(total=30),
+    )
+    try:
+        me = await _bot_api("getMe")
+    except Exception:
+        # Bad token or no network: don't leave the session and its connector open
+        await session.close()
+        session = None
+        raise
+    logger.info(f"Telegram notification bot started as @{me.get('username')}")
+    _keepalive_task = asyncio.create_task(_keepalive())
+    notify_queue = asyncio.Queue(maxsize=NOTIFY_QUEUE_SIZE)
+    _notify_worker_task = asyncio.create_task(_notification_worker())
     
     # Send a startup message
-    if ADMIN_CHAT_ID:
-        await bot.send_message(int(ADMIN_CHAT_ID), "🚀 News-Hack notification bot is now online!")
+    if ADMIN_CHAT_ID is not None:
+        await _send_admin_message("🚀 News-Hack notification bot is now online!")
 
 async def stop_bot():
     """Stop the bot"""
-    await bot.disconnect()
+    if _keepalive_task:
+        _keepalive_task.cancel()
+    if _notify_worker_task:
+        # Give queued notifications a chance to go out before disconnecting
+        try:
+            await asyncio.wait_for(notify_queue.join(), 5)
+        except asyncio.TimeoutError:
+            logger.warning(f"Dropping {notify_queue.qsize()} queued notifications on shutdown")
+        _notify_worker_task.cancel()
+    if session:
+        await session.close()
     logger.info("Telegram notification bot stopped")
 
 async def notify_new_subscriber(email, source="main"):
     """Notify about a new subscriber"""
-    if not ADMIN_CHAT_ID:
+    if ADMIN_CHAT_ID is None:
         logger.warning("No admin chat ID configured for notifications")
         return
 
     message = f"🎉 **New Subscriber**\n\n" \
               f"**Email:** {email}\n" \
               f"**Source:** {source}\n" \
-              f"**Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+              f"**Time:** {_now_str()}"
     
-    await bot.send_message(int(ADMIN_CHAT_ID), message)
-    logger.info(f"Sent notification about new subscriber: {email}")
+    await _enqueue_notification(message)
+    logger.info(f"Queued notification about new subscriber: {email}")
 
 def sync_notify_new_subscriber(email, source="main"):
-    """Synchronous wrapper for notify_new_subscriber"""
-    global bot_loop
-    if bot_loop and bot_loop.is_running():
-        future = asyncio.run_coroutine_threadsafe(notify_new_subscriber(email, source), bot_loop)
-        try:
-            future.result(10)  # Wait up to 10 seconds for the message to be sent
-            return True
-        except Exception as e:
-            logger.error(f"Failed to send subscriber notification: {e}")
-            return False
-    else:
-        logger.error("Bot loop is not running, cannot send notification")
-        return False
+    """Synchronous wrapper for notify_new_subscriber; schedules the notification without waiting for it"""
+    return _schedule(notify_new_subscriber(email, source), "subscriber")
 
 async def notify_new_feedback(email, feedback_type, message):
     """Notify about new feedback"""
-    if not ADMIN_CHAT_ID:
+    if ADMIN_CHAT_ID is None:
         logger.warning("No admin chat ID configured for notifications")
         return
 
@@ -76,29 +266,18 @@ async def notify_new_feedback(email, feedback_type, message):
                    f"**Email:** {email}\n" \
                    f"**Type:** {feedback_type}\n" \
                    f"**Message:**\n{message}\n\n" \
-                   f"**Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                   f"**Time:** {_now_str()}"
     
-    await bot.send_message(int(ADMIN_CHAT_ID), notification)
-    logger.info(f"Sent notification about new feedback from: {email}")
+    await _enqueue_notification(notification)
+    logger.info(f"Queued notification about new feedback from: {email}")
 
 def sync_notify_new_feedback(email, feedback_type, message):
-    """Synchronous wrapper for notify_new_feedback"""
-    global bot_loop
-    if bot_loop and bot_loop.is_running():
-        future = asyncio.run_coroutine_threadsafe(notify_new_feedback(email, feedback_type, message), bot_loop)
-        try:
-            future.result(10)  # Wait up to 10 seconds for the message to be sent
-            return True
-        except Exception as e:
-            logger.error(f"Failed to send feedback notification: {e}")
-            return False
-    else:
-        logger.error("Bot loop is not running, cannot send notification")
-        return False
+    """Synchronous wrapper for notify_new_feedback; schedules the notification without waiting for it"""
+    return _schedule(notify_new_feedback(email, feedback_type, message), "feedback")
 
 async def notify_summaries_request(request_id, period, sources):
     """Notify when summaries endpoint is called"""
-    if not ADMIN_CHAT_ID:
+    if ADMIN_CHAT_ID is None:
         logger.warning("No admin chat ID configured for notifications")
         return
 
@@ -107,102 +286,78 @@ async def notify_summaries_request(request_id, period, sources):
               f"**Request ID:** {request_id}\n" \
               f"**Period:** {period}\n" \
               f"**Sources:** {sources_text}\n" \
-              f"**Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+              f"**Time:** {_now_str()}"
     
-    await bot.send_message(int(ADMIN_CHAT_ID), message)
-    logger.info(f"Sent notification about summaries request: {request_id}")
+    await _enqueue_notification(message)
+    logger.info(f"Queued notification about summaries request: {request_id}")
 
 def sync_notify_summaries_request(request_id, period, sources):
-    """Synchronous wrapper for notify_summaries_request"""
-    global bot_loop
-    if bot_loop and bot_loop.is_running():
-        future = asyncio.run_coroutine_threadsafe(notify_summaries_request(request_id, period, sources), bot_loop)
-        try:
-            future.result(10)  # Wait up to 10 seconds for the message to be sent
-            return True
-        except Exception as e:
-            logger.error(f"Failed to send summaries notification: {e}")
-            return False
-    else:
-        logger.error("Bot loop is not running, cannot send notification")
-        return False
+    """Synchronous wrapper for notify_summaries_request; schedules the notification without waiting for it"""
+    return _schedule(notify_summaries_request(request_id, period, sources), "summaries")
 
 async def notify_insights_request(request_id, topic_count):
     """Notify when insights POST endpoint is called"""
-    if not ADMIN_CHAT_ID:
+    if ADMIN_CHAT_ID is None:
         logger.warning("No admin chat ID configured for notifications")
         return
 
     message = f"🧠 **Insights Endpoint Called**\n\n" \
               f"**Request ID:** {request_id}\n" \
               f"**Number of Topics:** {topic_count}\n" \
-              f"**Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+              f"**Time:** {_now_str()}"
     
-    await bot.send_message(int(ADMIN_CHAT_ID), message)
-    logger.info(f"Sent notification about insights request: {request_id}")
+    await _enqueue_notification(message)
+    logger.info(f"Queued notification about insights request: {request_id}")
 
 def sync_notify_insights_request(request_id, topic_count):
-    """Synchronous wrapper for notify_insights_request"""
-    global bot_loop
-    if bot_loop and bot_loop.is_running():
-        future = asyncio.run_coroutine_threadsafe(notify_insights_request(request_id, topic_count), bot_loop)
-        try:
-            future.result(10)  # Wait up to 10 seconds for the message to be sent
-            return True
-        except Exception as e:
-            logger.error(f"Failed to send insights notification: {e}")
-            return False
-    else:
-        logger.error("Bot loop is not running, cannot send notification")
-        return False
+    """Synchronous wrapper for notify_insights_request; schedules the notification without waiting for it"""
+    return _schedule(notify_insights_request(request_id, topic_count), "insights")
 
 async def notify_data_fetcher_completion(telegram_results, rss_results):
     """Notify when data fetcher completes its work"""
-    if not ADMIN_CHAT_ID:
+    if ADMIN_CHAT_ID is None:
         logger.warning("No admin chat ID configured for notifications")
         return
 
     # Prepare the message
-    message = f"🔄 **Data Fetcher Completed**\n\n" \
-              f"**Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    lines = ["🔄 **Data Fetcher Completed**", "", f"**Time:** {_now_str()}", ""]
     
     # Add Telegram results
     if telegram_results:
-        message += "**Telegram Channels:**\n"
-        for channel, message_ids in telegram_results.items():
-            channel_name = channel.split('/')[-1] if '/' in channel else channel
-            message += f"- {channel_name}: {len(message_ids)} messages\n"
+        lines.append("**Telegram Channels:**")
+        lines.extend(f"- {channel.rsplit('/', 1)[-1]}: {len(message_ids)} messages"
+                     for channel, message_ids in telegram_results.items())
     
     # Add RSS results
     if rss_results:
-        message += "\n**RSS Feeds:**\n"
-        for feed, message_ids in rss_results.items():
-            feed_name = feed.split('//')[-1].split('/')[0]  # Extract domain
-            message += f"- {feed_name}: {len(message_ids)} messages\n"
+        lines.extend(["", "**RSS Feeds:**"])
+        lines.extend(f"- {feed.split('//')[-1].split('/', 1)[0]}: {len(message_ids)} messages"  # Extract domain
+                     for feed, message_ids in rss_results.items())
+    
+    message = "\n".join(lines) + "\n"
     
-    await bot.send_message(int(ADMIN_CHAT_ID), message)
-    logger.info("Sent notification about data fetcher completion")
+    await _enqueue_notification(message)
+    logger.info("Queued notification about data fetcher completion")
 
 def sync_notify_data_fetcher_completion(telegram_results, rss_results):
-    """Synchronous wrapper for notify_data_fetcher_completion"""
-    global bot_loop
-    if bot_loop and bot_loop.is_running():
-        future = asyncio.run_coroutine_threadsafe(notify_data_fetcher_completion(telegram_results, rss_results), bot_loop)
-        try:
-            future.result(10)  # Wait up to 10 seconds for the message to be sent
-            return True
-        except Exception as e:
-            logger.error(f"Failed to send data fetcher completion notification: {e}")
-            return False
-    else:
-        logger.error("Bot loop is not running, cannot send notification")
-        return False
+    """Synchronous wrapper for notify_data_fetcher_completion; schedules the notification without waiting for it"""
+    return _schedule(notify_data_fetcher_completion(telegram_results, rss_results), "data fetcher completion")
 
 # Initialize bot in a non-blocking way
 def init_bot():
-    """Initialize the bot without blocking"""
-    global bot_loop
-    loop = asyncio.new_event_loop()
+    """
+    Initialize the bot without blocking.
+
+    The bot gets its own event loop in a daemon thread (uvloop when installed), and the
+    sync_notify_* wrappers hand notifications to it. A host that already runs an asyncio
+    loop (e.g. an ASGI server) can instead await start_bot() on that loop and call the
+    notify_* coroutines directly, without a second thread.
+    """
+    global bot_loop, _submit
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    # Run notification coroutines inline up to their first real await (Python 3.12+)
+    if sys.version_info >= (3, 12):
+        loop.set_task_factory(asyncio.eager_task_factory)
     asyncio.set_event_loop(loop)
     loop.run_until_complete(start_bot())
     bot_loop = loop
@@ -215,6 +370,7 @@ def init_bot():
     import threading
     thread = threading.Thread(target=run_loop_forever, args=(loop,), daemon=True)
     thread.start()
+    _submit = partial(loop.call_soon_threadsafe, _start_notification)
     
     return loop
 
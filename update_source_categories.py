@@ -1,7 +1,8 @@
 import sqlite3
 import os
 import logging
-from config import DATABASE, LOG_FILE
+from config import LOG_FILE
+from db_utils import get_db_connection
 
 # Configure logging
 logging.basicConfig(
@@ -14,12 +15,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def get_db_connection():
-    """Create and return a database connection"""
-    conn = sqlite3.connect(DATABASE)
-    conn.row_factory = sqlite3.Row  # Return rows as dictionaries
-    return conn
-
 def update_source_categories():
     """Update existing sources with category information"""
 
@@ -29,13 +24,18 @@ def update_source_categories():
         cursor = conn.cursor()
         
         # First check if category column exists
-        cursor.execute("PRAGMA table_info(sources)")
-        columns = cursor.fetchall()
-        has_category = any(column['name'] == 'category' for column in columns)
+        cursor.execute("SELECT 1 FROM pragma_table_info('sources') WHERE name = 'category'")
+        has_category = cursor.fetchone() is not None
         
         if not has_category:
             logger.info("Adding category column to sources table")
-            cursor.execute("ALTER TABLE sources ADD COLUMN category TEXT DEFAULT 'Web3'")
+            try:
+                cursor.execute("ALTER TABLE sources ADD COLUMN category TEXT DEFAULT 'Web3'")
+            except sqlite3.OperationalError as e:
+                # Another run added the column after the check; anything else (e.g. a locked database) is a real error
+                if "duplicate column name" not in str(e):
+                    raise
+                logger.info(f"Category column already present: {e}")
         
         # # Update categories for known sources
         # update_count = 0
@@ -58,9 +58,6 @@ def update_source_categories():
         
     except sqlite3.Error as e:
         logger.error(f"Error updating source categories: {e}")
-    finally:
-        if conn:
-            conn.close()
 
 if __name__ == "__main__":
     logger.info("Starting update of source categories")
@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
-import sqlite3
 import logging
 import sys
-import re
-from config import DATABASE, LOG_FILE
+from config import LOG_FILE
+from db_utils import get_db_connection
 
 # Configure logging
 logging.basicConfig(
@@ -16,13 +15,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger('update_source_types')
 
-def get_db_connection():
-    """Create and return a database connection"""
-    logger.debug(f"Opening database connection to {DATABASE}")
-    conn = sqlite3.connect(DATABASE)
-    conn.row_factory = sqlite3.Row  # Return rows as dictionaries
-    logger.debug("Database connection established")
-    return conn
+# URL prefixes that identify Telegram channels
+TELEGRAM_URL_PREFIXES = ('http://t.me/', 'https://t.me/')
 
 def update_existing_sources():
     """
@@ -49,26 +43,30 @@ def update_existing_sources():
                 
             logger.info(f"Found {len(results)} sources with missing source_type")
             
-            # Process each source
+            # Classify each source, then apply all updates in one batch
+            updates = []
+            telegram_count = 0
             for source in results:
                 source_id = source['id']
                 url = source['url']
                 
                 # Determine source type based on URL pattern
-                if re.match(r'^https?://t\.me/', url):
+                if url.startswith(TELEGRAM_URL_PREFIXES):
                     source_type = 'telegram'
-                    logger.info(f"Identified source {source_id} as telegram: {url}")
+                    telegram_count += 1
+                    logger.debug("Identified source %s as telegram: %s", source_id, url)
                 else:
                     # Default to RSS for now - we can't easily validate without parsing
                     source_type = 'rss'
-                    logger.info(f"Assuming source {source_id} is RSS feed: {url}")
+                    logger.debug("Assuming source %s is RSS feed: %s", source_id, url)
                 
-                # Update the source_type
-                cursor.execute(
-                    "UPDATE sources SET source_type = ? WHERE id = ?",
-                    (source_type, source_id)
-                )
-                updated_count += 1
+                updates.append((source_type, source_id))
+            
+            # Update the source_type (autocommit connection, so open the transaction explicitly)
+            cursor.execute("BEGIN")
+            cursor.executemany("UPDATE sources SET source_type = ? WHERE id = ?", updates)
+            updated_count = len(updates)
+            logger.info(f"Classified {telegram_count} telegram, {updated_count - telegram_count} rss sources")
             
             conn.commit()
             logger.info(f"Updated {updated_count} sources with appropriate source types")